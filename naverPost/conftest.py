@@ -0,0 +1,27 @@
+"""
+Shared pytest fixtures for the regression test suite
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 한 번만 sys.path에 추가 (테스트 모듈마다 반복하지 않음)
+PROJECT_ROOT = Path(__file__).resolve().parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture(scope="session")
+def blog_workflow_service():
+    """세션 전체에서 공유하는 BlogWorkflowService (컴포넌트 초기화 1회)"""
+    from src.services.blog_workflow import get_blog_workflow_service
+    return get_blog_workflow_service()
+
+
+@pytest.fixture(scope="session")
+def telegram_service():
+    """세션 전체에서 공유하는 TelegramBotService"""
+    from src.services.telegram_service import get_telegram_service
+    return get_telegram_service()
@@ -23,6 +23,22 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 os.chdir(PROJECT_ROOT)
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode('utf-8')
+
+    _loads = orjson.loads
+except ImportError:
+    # orjson이 없으면 표준 json으로 대체 (같은 2칸 들여쓰기 형식)
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=str)
+
+    _loads = json.loads
+
 try:
     from src.quality.content_checker import ContentQualityChecker
     MODULES_AVAILABLE = True
@@ -30,20 +46,32 @@ except ImportError as e:
     print(f"Warning: Some modules not available: {e}")
     MODULES_AVAILABLE = False
 
+# 전역 인스턴스 (여러 프로젝트를 연속 분석할 때 재사용)
+_content_checker: Optional["ContentQualityChecker"] = None
+
+
+def get_content_checker() -> "ContentQualityChecker":
+    """전역 ContentQualityChecker 인스턴스 반환"""
+    global _content_checker
+    if _content_checker is None:
+        _content_checker = ContentQualityChecker()
+    return _content_checker
+
 
 class ContentCheckerTester:
     """개인 경험 비율 분석 테스트 클래스"""
 
     def __init__(self, project_id: str):
         self.project_id = project_id
-        self.project_dir = Path(f"data/{project_id}")
+        self.project_dir = Path("data", project_id)
         self.meta_path = self.project_dir / "meta.json"
         self.generated_blog_path = self.project_dir / "generated_blog.txt"
         self.content_analysis_report_path = self.project_dir / "content_analysis_report.json"
         self.logs_dir = self.project_dir / "logs"
-
-        # 디렉토리 생성
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        self.log_file = self.logs_dir / "content_checker_log.jsonl"
+        self._log_fp = None
+        self._meta_cache: Optional[Dict] = None
+        self._blog_cache: Optional[str] = None
 
     def log_event(self, stage: str, status: str, message: str, **kwargs):
         """구조화된 로그 기록"""
@@ -62,19 +90,21 @@ class ContentCheckerTester:
             if value is not None:
                 print(f"  └─ {key}: {value}")
 
-        # JSON 로그 파일에 기록
-        log_file = self.logs_dir / "content_checker_log.json"
-
-        if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-        else:
-            logs = []
-
-        logs.append(log_entry)
+        # JSONL 로그 파일에 한 줄씩 추가 (기존 로그를 다시 읽거나 덮어쓰지 않음)
+        if self._log_fp is None:
+            if not self.project_dir.is_dir():
+                # 존재하지 않는 프로젝트에는 로그 디렉토리를 만들지 않음 (콘솔 출력만)
+                return
+            # 로그 디렉토리는 첫 로그 기록 시점에 생성
+            self.logs_dir.mkdir(exist_ok=True)
+            self._log_fp = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+        self._log_fp.write(json.dumps(log_entry, ensure_ascii=False, default=str) + '\n')
 
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(logs, f, ensure_ascii=False, indent=2, default=str)
+    def close_log(self):
+        """로그 파일 핸들 정리"""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
 
     def check_prerequisites(self) -> bool:
         """사전 요구사항 확인"""
@@ -85,34 +115,47 @@ class ContentCheckerTester:
             self.log_event("prerequisites", "failed", "필요 모듈이 설치되지 않았습니다")
             return False
 
+        # 프로젝트 디렉토리를 한 번만 스캔해 두 파일의 존재 여부를 확인
+        try:
+            with os.scandir(self.project_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            # 프로젝트 디렉토리가 없으면 두 파일 모두 없는 것으로 처리
+            entries = {}
+
         # 2. 메타 파일 존재 확인
-        if not self.meta_path.exists():
+        if self.meta_path.name not in entries:
             self.log_event("prerequisites", "failed", f"메타 파일이 없습니다: {self.meta_path}")
             return False
 
         # 3. 생성된 블로그 글 파일 존재 확인
-        if not self.generated_blog_path.exists():
+        blog_entry = entries.get(self.generated_blog_path.name)
+        if blog_entry is None:
             self.log_event("prerequisites", "failed", f"블로그 글 파일이 없습니다: {self.generated_blog_path}")
             return False
 
-        file_size = self.generated_blog_path.stat().st_size
+        file_size = blog_entry.stat().st_size
+
         self.log_event("prerequisites", "completed", "모든 사전 요구사항이 충족되었습니다",
                       meta_file_exists=True,
                       blog_file_size=file_size)
         return True
 
     def load_data(self) -> tuple[Optional[Dict], Optional[str]]:
-        """메타 데이터와 블로그 콘텐츠 로드"""
+        """메타 데이터와 블로그 콘텐츠 로드 (인스턴스당 한 번만 읽고 캐시)"""
+        if self._meta_cache is not None and self._blog_cache is not None:
+            return self._meta_cache, self._blog_cache
+
         self.log_event("data_loading", "info", "데이터 로드 시작")
 
         try:
             # 메타 데이터 로드
-            with open(self.meta_path, 'r', encoding='utf-8') as f:
-                meta_data = json.load(f)
+            meta_data = _loads(self.meta_path.read_bytes())
 
             # 블로그 콘텐츠 로드
-            with open(self.generated_blog_path, 'r', encoding='utf-8') as f:
-                blog_content = f.read().strip()
+            blog_content = self.generated_blog_path.read_text(encoding='utf-8').strip()
+
+            self._meta_cache, self._blog_cache = meta_data, blog_content
 
             self.log_event("data_loading", "completed", "데이터 로드 성공",
                           meta_data_keys=list(meta_data.keys()),
@@ -129,8 +172,8 @@ class ContentCheckerTester:
         self.log_event("content_analysis", "info", "개인 경험 비율 분석 시작")
 
         try:
-            # ContentQualityChecker 초기화
-            checker = ContentQualityChecker()
+            # ContentQualityChecker (전역 인스턴스 재사용)
+            checker = get_content_checker()
 
             # 개인 경험 비율 분석
             analysis_result = checker.analyze_personal_experience_ratio(
@@ -173,12 +216,12 @@ class ContentCheckerTester:
                     "meta_file": str(self.meta_path),
                     "blog_file": str(self.generated_blog_path),
                     "report_file": str(self.content_analysis_report_path),
-                    "log_file": str(self.logs_dir / "content_checker_log.json")
+                    "log_file": str(self.log_file)
                 }
             }
 
             with open(self.content_analysis_report_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, ensure_ascii=False, indent=2, default=str)
+                f.write(_dumps(report_data))
 
             self.log_event("report_saving", "completed", "분석 보고서 저장 성공")
 
@@ -209,12 +252,20 @@ class ContentCheckerTester:
             # 세부 점수
             scores = overall_eval["individual_scores"]
             weights = overall_eval["weights"]
+            sim, pers, exp, emo, spec = (
+                scores['similarity'], scores['personal_expression'], scores['experience_reflection'],
+                scores['emotion_authenticity'], scores['specificity']
+            )
+            sim_w, pers_w, exp_w, emo_w, spec_w = (
+                weights['similarity'], weights['personal_expression'], weights['experience_reflection'],
+                weights['emotion_authenticity'], weights['specificity']
+            )
             print(f"\n📈 세부 점수:")
-            print(f"   📝 유사도 점수: {scores['similarity']:.3f} ({weights['similarity']:.0%})")
-            print(f"   👤 개인표현 점수: {scores['personal_expression']:.3f} ({weights['personal_expression']:.0%})")
-            print(f"   💭 경험반영 점수: {scores['experience_reflection']:.3f} ({weights['experience_reflection']:.0%})")
-            print(f"   ❤️  감정진정성 점수: {scores['emotion_authenticity']:.3f} ({weights['emotion_authenticity']:.0%})")
-            print(f"   🔍 구체성 점수: {scores['specificity']:.3f} ({weights['specificity']:.0%})")
+            print(f"   📝 유사도 점수: {sim:.3f} ({sim_w:.0%})")
+            print(f"   👤 개인표현 점수: {pers:.3f} ({pers_w:.0%})")
+            print(f"   💭 경험반영 점수: {exp:.3f} ({exp_w:.0%})")
+            print(f"   ❤️  감정진정성 점수: {emo:.3f} ({emo_w:.0%})")
+            print(f"   🔍 구체성 점수: {spec:.3f} ({spec_w:.0%})")
 
             # 세부 분석
             print(f"\n🔍 세부 분석:")
@@ -241,7 +292,7 @@ class ContentCheckerTester:
 
         print(f"\n📁 생성된 파일:")
         print(f"   - {self.content_analysis_report_path}")
-        print(f"   - {self.logs_dir / 'content_checker_log.json'}")
+        print(f"   - {self.log_file}")
 
     def run_full_analysis(self):
         """전체 개인 경험 비율 분석 프로세스 실행"""
@@ -286,6 +337,8 @@ class ContentCheckerTester:
             self.log_event("full_process", "failed", f"전체 프로세스 실행 실패: {str(e)}")
             print(f"\n❌ 전체 프로세스 실행 실패: {str(e)}")
             raise
+        finally:
+            self.close_log()
 
 
 def main():
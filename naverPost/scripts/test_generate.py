@@ -13,20 +13,36 @@ Phase 2 테스트 스크립트 - 웹 인터페이스 없이 블로그 글 생성
 import sys
 import json
 import os
+import re
 import stat
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any
 
 # 프로젝트 루트를 파이썬 경로에 추가 (scripts/ 아래로 이동했기 때문)
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 os.chdir(PROJECT_ROOT)
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    # orjson이 없으면 표준 json으로 대체
+    _loads = json.loads
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """임시 파일에 쓴 뒤 교체 (중간에 중단돼도 기존 파일이 깨지지 않음)"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 try:
     from src.content.models import (
         MetaJsonData, AnalysisJsonData, GenerationReadyData,
-        UserDirectInput, PipelineLogEntry
+        PipelineLogEntry, LocationInfo
     )
     from src.content.experience_processor import ExperienceProcessor
     from src.content.blog_generator import HashtagGenerator, ContentStructureBuilder
@@ -37,6 +53,24 @@ except ImportError as e:
     print("Running in basic mode without full functionality")
     MODULES_AVAILABLE = False
 
+# generation_ready.json의 merged_data로 옮기는 user_input 필드
+_MERGED_USER_INPUT_FIELDS = frozenset({
+    "category", "rating", "visit_date", "companion", "personal_review", "ai_additional_script"
+})
+
+# Fallback 패턴 매칭 테이블 (우선순위 순) - 정규식은 모듈 로드 시 한 번만 컴파일
+_FALLBACK_LOCATION_PATTERNS = (
+    ("강남역", "서울특별시 강남구 강남역 근처", 0.85),
+    ("홍대", "서울특별시 마포구 홍대 근처", 0.80),
+)
+_FALLBACK_LOCATION_RE = re.compile("|".join(re.escape(keyword) for keyword, _, _ in _FALLBACK_LOCATION_PATTERNS))
+
+
+def _final_location_name(final_location: Dict[str, Any]) -> Optional[str]:
+    """final_location의 위치명 (엔진 결과는 detected_location, fallback은 location 키 사용)"""
+    return final_location.get("detected_location") or final_location.get("location")
+
+
 class PipelineRunner:
     """테스트 파이프라인 실행 클래스"""
 
@@ -47,6 +81,13 @@ class PipelineRunner:
         self.analysis_path = self.project_dir / "analysis.json"
         self.generation_ready_path = self.project_dir / "generation_ready.json"
         self.logs_dir = self.project_dir / "logs"
+        # JSON Lines 형식 (이벤트당 한 줄, append)
+        self.log_path = self.logs_dir / "pipeline_log.jsonl"
+        self._log_fp = None
+        # ExperienceProcessor 결과 캐시 (EXIF/위치/키워드 단계에서 공유)
+        self._processor = None
+        self._experience_result: Optional[Dict[str, Any]] = None
+        self._meta_stat: Optional[os.stat_result] = None
 
         # 디렉토리 생성
         self.logs_dir.mkdir(parents=True, exist_ok=True)
@@ -65,33 +106,39 @@ class PipelineRunner:
         if confidence is not None:
             print(f"  └─ Confidence: {confidence:.2f}")
 
-        # JSON 로그 파일에 기록
-        log_file = self.logs_dir / "pipeline_log.json"
-
-        if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-        else:
-            logs = []
+        # 파일 기록 (첫 로그 시점에 한 번만 열고 이후에는 한 줄씩 추가)
+        if self._log_fp is None:
+            self._log_fp = open(self.log_path, 'a', encoding='utf-8', buffering=1)
+        self._log_fp.write(log_entry.model_dump_json() + '\n')
 
-        logs.append(log_entry.model_dump(mode='json'))
+    def close_log(self):
+        """로그 파일 핸들 정리"""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
 
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(logs, f, ensure_ascii=False, indent=2, default=str)
+    def _get_experience_result(self, meta_data: MetaJsonData) -> Dict[str, Any]:
+        """ExperienceProcessor 처리 결과 반환 (첫 호출 시 한 번만 처리)"""
+        if self._experience_result is None:
+            self._processor = ExperienceProcessor(self.project_dir)
+            self._experience_result = self._processor.process_user_experience(meta_data.user_input, meta_data.images)
+        return self._experience_result
 
     def load_and_validate_meta(self) -> MetaJsonData:
         """meta.json 로드 및 검증"""
         self.log_event("meta_loading", "info", f"Loading meta.json from {self.meta_path}")
 
-        if not self.meta_path.exists():
+        try:
+            # make_meta_readonly에서 권한 확인용으로 재사용
+            self._meta_stat = self.meta_path.stat()
+        except FileNotFoundError:
             raise FileProcessingError(
                 f"meta.json 파일을 찾을 수 없습니다: {self.meta_path}",
                 file_path=str(self.meta_path)
             )
 
         try:
-            with open(self.meta_path, 'r', encoding='utf-8') as f:
-                meta_data = json.load(f)
+            meta_data = _loads(self.meta_path.read_bytes())
 
             # Pydantic 모델로 검증
             validated_meta = MetaJsonData(**meta_data)
@@ -110,13 +157,20 @@ class PipelineRunner:
         images_status = {}
         images_dir = self.project_dir / "images"
 
+        # images 디렉토리를 한 번만 스캔 (파일별 exists()/stat() 호출 대신)
+        try:
+            with os.scandir(images_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            entries = {}
+
         for filename in meta_data.images:
-            image_path = images_dir / filename
-            exists = image_path.exists()
+            entry = entries.get(filename)
+            exists = entry is not None
             images_status[filename] = exists
 
             if exists:
-                file_size = image_path.stat().st_size
+                file_size = entry.stat().st_size
                 self.log_event("image_check", "info", f"이미지 발견: {filename} ({file_size} bytes)")
             else:
                 self.log_event("image_check", "warning", f"이미지 누락: {filename}")
@@ -145,8 +199,7 @@ class PipelineRunner:
             return exif_result
 
         # 실제 EXIF 처리기 사용
-        processor = ExperienceProcessor(self.project_dir)
-        result = processor.process_user_experience(meta_data.user_input, meta_data.images)
+        result = self._get_experience_result(meta_data)
 
         exif_result = result["location_analysis"]["exif_results"]
         confidence = exif_result.get("exif_confidence", 0.0)
@@ -165,14 +218,14 @@ class PipelineRunner:
             confidence = 0.0
             matched_patterns = []
 
-            if "강남역" in personal_review:
-                location = "서울특별시 강남구 강남역 근처"
-                confidence = 0.85
-                matched_patterns = ["강남역"]
-            elif "홍대" in personal_review:
-                location = "서울특별시 마포구 홍대 근처"
-                confidence = 0.80
-                matched_patterns = ["홍대"]
+            # 한 번의 스캔으로 모든 후보를 찾은 뒤 우선순위가 가장 높은 패턴 선택
+            found = set(_FALLBACK_LOCATION_RE.findall(personal_review))
+            for keyword, candidate_location, candidate_confidence in _FALLBACK_LOCATION_PATTERNS:
+                if keyword in found:
+                    location = candidate_location
+                    confidence = candidate_confidence
+                    matched_patterns = [keyword]
+                    break
 
             text_analysis = {
                 "detected_location": location,
@@ -190,15 +243,14 @@ class PipelineRunner:
             }
         else:
             # 실제 위치 추론 엔진 사용
-            processor = ExperienceProcessor(self.project_dir)
-            result = processor.process_user_experience(meta_data.user_input, meta_data.images)
+            result = self._get_experience_result(meta_data)
             location_analysis = result["location_analysis"]
 
             text_analysis = location_analysis["text_analysis"]
             final_location = location_analysis["final_location"]
 
         status = "completed"
-        message = f"위치 추론 완료: {final_location.get('detected_location') or final_location.get('location') or '추론 실패'}"
+        message = f"위치 추론 완료: {_final_location_name(final_location) or '추론 실패'}"
         self.log_event("location_inference", status, message, confidence=final_location['confidence'])
 
         return {
@@ -216,28 +268,27 @@ class PipelineRunner:
 
         if not MODULES_AVAILABLE:
             # Fallback to simple rule-based generation
-            candidates = self._generate_simple_hashtags(user_input, final_location_data.get("detected_location") or final_location_data.get("location"))
+            from src.content.fallback_hashtags import generate_simple_hashtags
+            candidates = generate_simple_hashtags(user_input, _final_location_name(final_location_data))
+            all_tags = list(dict.fromkeys(tag for tags in candidates.values() for tag in tags))
             refined_tags = {
-                "deduplicated": list(dict.fromkeys([tag for tags in candidates.values() for tag in tags])),
-                "semantic_filtered": list(dict.fromkeys([tag for tags in candidates.values() for tag in tags])),
-                "final_tags": list(dict.fromkeys([tag for tags in candidates.values() for tag in tags]))[:6]
+                "deduplicated": all_tags,
+                "semantic_filtered": all_tags,
+                "final_tags": all_tags[:6]
             }
             confidence = 0.8 if refined_tags["final_tags"] else 0.0
         else:
             # 실제 해시태그 생성기 사용
-            from src.content.models import LocationInfo
-
             # LocationInfo 객체 생성
             location_info = LocationInfo(
-                detected_location=final_location_data.get("detected_location") or final_location_data.get("location"),
+                detected_location=_final_location_name(final_location_data),
                 coordinates=final_location_data.get("coordinates"),
                 source=final_location_data["source"],
                 confidence=final_location_data["confidence"]
             )
 
             # 키워드 추출
-            processor = ExperienceProcessor(self.project_dir)
-            result = processor.process_user_experience(user_input, meta_data.images)
+            result = self._get_experience_result(meta_data)
             extracted_keywords = result.get("extracted_keywords", [])
 
             # 해시태그 후보 생성
@@ -258,46 +309,6 @@ class PipelineRunner:
             "tag_confidence": confidence
         }
 
-    def _generate_simple_hashtags(self, user_input: UserDirectInput, location: Optional[str]) -> Dict[str, List[str]]:
-        """간단한 해시태그 생성 (Fallback)"""
-        candidates = {
-            "category_based": [],
-            "rating_based": [],
-            "companion_based": [],
-            "keyword_based": [],
-            "location_based": []
-        }
-
-        # 카테고리 기반
-        if user_input.category == "맛집":
-            candidates["category_based"] = ["#맛집", "#음식"]
-
-        # 별점 기반
-        if user_input.rating == 5:
-            candidates["rating_based"] = ["#강추", "#최고"]
-        elif user_input.rating == 4:
-            candidates["rating_based"] = ["#추천", "#좋아요"]
-
-        # 동행자 기반
-        if user_input.companion == "가족":
-            candidates["companion_based"] = ["#가족식사"]
-
-        # 간단한 키워드 추출
-        review = user_input.personal_review
-        if "이탈리안" in review:
-            candidates["keyword_based"].append("#이탈리안")
-        if "파스타" in review:
-            candidates["keyword_based"].append("#파스타")
-        if "알리오올리오" in review:
-            candidates["keyword_based"].append("#알리오올리오")
-
-        # 위치 기반 (location이 None이 아닐 때만)
-        if location:
-            if "강남" in location:
-                candidates["location_based"] = ["#강남맛집"]
-
-        return candidates
-
     def save_analysis_results(self, meta_data: MetaJsonData, location_analysis: Dict[str, Any], hashtag_analysis: Dict[str, Any]):
         """analysis.json 저장"""
         self.log_event("save_analysis", "info", f"analysis.json 저장 중: {self.analysis_path}")
@@ -318,8 +329,7 @@ class PipelineRunner:
             }
         )
 
-        with open(self.analysis_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis_data.model_dump(mode='json'), f, ensure_ascii=False, indent=2, default=str)
+        _atomic_write_bytes(self.analysis_path, analysis_data.model_dump_json(indent=2).encode('utf-8'))
 
         self.log_event("save_analysis", "completed", "analysis.json 저장 완료")
 
@@ -329,16 +339,11 @@ class PipelineRunner:
 
         # analysis.json에서 최종 데이터 추출
         final_location = analysis_data["location_analysis"]["final_location"]
-        location = final_location.get("detected_location") or final_location.get("location")
+        location = _final_location_name(final_location)
         hashtags = analysis_data["hashtag_analysis"]["refined_tags"]["final_tags"]
 
         merged_data = {
-            "category": meta_data.user_input.category,
-            "rating": meta_data.user_input.rating,
-            "visit_date": meta_data.user_input.visit_date,
-            "companion": meta_data.user_input.companion,
-            "personal_review": meta_data.user_input.personal_review,
-            "ai_additional_script": meta_data.user_input.ai_additional_script,
+            **meta_data.user_input.model_dump(include=_MERGED_USER_INPUT_FIELDS),
             "location": location,  # None 가능
             "hashtags": hashtags,
             "images": meta_data.images
@@ -350,16 +355,21 @@ class PipelineRunner:
             generation_settings=meta_data.settings
         )
 
-        with open(self.generation_ready_path, 'w', encoding='utf-8') as f:
-            json.dump(generation_ready.model_dump(mode='json'), f, ensure_ascii=False, indent=2, default=str)
+        _atomic_write_bytes(self.generation_ready_path, generation_ready.model_dump_json(indent=2).encode('utf-8'))
 
         self.log_event("save_generation_ready", "completed", "generation_ready.json 저장 완료")
 
     def make_meta_readonly(self):
         """meta.json을 읽기 전용으로 설정"""
-        if self.meta_path.exists():
-            os.chmod(self.meta_path, stat.S_IREAD)
-            self.log_event("meta_protection", "completed", "meta.json 읽기 전용으로 설정")
+        meta_stat = self._meta_stat
+        if meta_stat is None:
+            if not self.meta_path.exists():
+                return
+        elif not meta_stat.st_mode & stat.S_IWUSR:
+            # 이전 실행에서 이미 읽기 전용으로 바뀐 상태
+            return
+        os.chmod(self.meta_path, stat.S_IREAD)
+        self.log_event("meta_protection", "completed", "meta.json 읽기 전용으로 설정")
 
     def run_full_pipeline(self):
         """전체 파이프라인 실행"""
@@ -402,7 +412,7 @@ class PipelineRunner:
 
             # 결과 요약 출력
             final_location_data = location_analysis["final_location"]
-            final_location = final_location_data.get("detected_location") or final_location_data.get("location")
+            final_location = _final_location_name(final_location_data)
             final_hashtags = hashtag_analysis["refined_tags"]["final_tags"]
 
             print(f"📍 추론된 위치: {final_location or '추론 실패'}")
@@ -410,7 +420,7 @@ class PipelineRunner:
             print(f"📁 생성된 파일:")
             print(f"   - {self.analysis_path}")
             print(f"   - {self.generation_ready_path}")
-            print(f"📝 로그 파일: {self.logs_dir / 'pipeline_log.json'}")
+            print(f"📝 로그 파일: {self.log_path}")
 
             self.log_event("pipeline", "completed", "전체 파이프라인 실행 성공")
 
@@ -418,6 +428,8 @@ class PipelineRunner:
             self.log_event("pipeline", "failed", f"파이프라인 실행 실패: {str(e)}")
             print(f"\n❌ 파이프라인 실행 실패: {str(e)}")
             raise
+        finally:
+            self.close_log()
 
 
 def main():
@@ -14,6 +14,39 @@ from src.content.models import (
 )
 
 
+# 후처리/품질 지표에서 매 호출마다 쓰는 정규식은 모듈 로드 시 한 번만 컴파일한다
+# AI 전형 표현 (순서대로 하나씩 제거 — 앞 패턴 제거 결과가 뒤 패턴 매칭에 영향을 줄 수 있음)
+_AI_PHRASE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'오늘은? 소개하려고\s*,?',
+    r'특별한 경험을 나누고 싶어\s*,?',
+    r'여러분께? 추천드립니다?\s*,?',
+    r'완벽했습니다\s*,?',
+    r'최고였습니다\s*,?',
+    r'강력 추천드립니다?\s*,?',
+    r'총정리하면\s*,?',
+    r'도움이 되셨다면\s*,?',
+    r'마무리하겠습니다\s*,?',
+    r'꼭 방문해보세요\s*,?',
+    r'인생 맛집\s*,?',
+    r'여러분\s*,?',
+    r'모든 분들께\s*,?',
+    r'정리하자면\s*,?',
+    r'소개해\s*드릴게요\s*,?',
+    r'총평\s*:?\s*',
+    r'결론적으로\s*,?',
+))
+_UNNAMED_PHOTO_RE = re.compile(r'\s*\(사진\)\s*')
+_NUMBERED_PHOTO_PAREN_RE = re.compile(r'\(사진(\d+)\)')
+_PHOTO_MARKER_SPACING_RE = re.compile(r'\s*\[사진(\d+)\]\s*')
+_INLINE_HASHTAG_RE = re.compile(r'#[가-힣a-zA-Z0-9_]+')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{4,}')
+_IMAGE_MARKER_RE = re.compile(r'\[사진\d+\]')
+_CONSECUTIVE_PHOTO_RE = re.compile(r'\[사진\d+\]\s*\n?\s*\[사진\d+\]')
+_PRICE_RE = re.compile(r'\d+원')
+_HOUR_RE = re.compile(r'\d+시')
+_PARKING_DETAIL_RE = re.compile(r'주차\s*(가능|무료|유료|\d+대)')
+
+
 class HashtagGenerator:
     """해시태그 자동 생성 클래스"""
 
@@ -941,27 +974,8 @@ class BlogContentGenerator:
         content = content.strip('"\'')
 
         # 2. AI 전형 표현 강력 필터링 (목록 확대)
-        ai_patterns = [
-            r'오늘은? 소개하려고\s*,?',
-            r'특별한 경험을 나누고 싶어\s*,?',
-            r'여러분께? 추천드립니다?\s*,?',
-            r'완벽했습니다\s*,?',
-            r'최고였습니다\s*,?',
-            r'강력 추천드립니다?\s*,?',
-            r'총정리하면\s*,?',
-            r'도움이 되셨다면\s*,?',
-            r'마무리하겠습니다\s*,?',
-            r'꼭 방문해보세요\s*,?',
-            r'인생 맛집\s*,?',
-            r'여러분\s*,?',
-            r'모든 분들께\s*,?',
-            r'정리하자면\s*,?',
-            r'소개해\s*드릴게요\s*,?',
-            r'총평\s*:?\s*',
-            r'결론적으로\s*,?',
-        ]
-        for pattern in ai_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+        for pattern in _AI_PHRASE_PATTERNS:
+            content = pattern.sub('', content)
 
         # 3. 이미지 마커 포맷 정규화 — 다양한 형태를 [사진N]으로 통일
         # (사진) → [사진N] 순차 치환
@@ -971,19 +985,19 @@ class BlogContentGenerator:
             photo_counter[0] += 1
             return f"\n\n[사진{photo_counter[0]}]\n\n"
 
-        content = re.sub(r'\s*\(사진\)\s*', _replace_unnamed_photo, content)
+        content = _UNNAMED_PHOTO_RE.sub(_replace_unnamed_photo, content)
 
         # (사진N) → [사진N]
-        content = re.sub(r'\(사진(\d+)\)', r'[사진\1]', content)
+        content = _NUMBERED_PHOTO_PAREN_RE.sub(r'[사진\1]', content)
 
         # 이미 [사진N] 형태인 것은 유지, 주변 줄바꿈 정리
-        content = re.sub(r'\s*\[사진(\d+)\]\s*', r'\n\n[사진\1]\n\n', content)
+        content = _PHOTO_MARKER_SPACING_RE.sub(r'\n\n[사진\1]\n\n', content)
 
         # 4. 해시태그 처리 (맨 마지막에 5개 이하만)
         hashtags = merged_data.get("hashtags", [])
 
         # 기존 해시태그 제거 (글 중간에 있을 수 있음)
-        content = re.sub(r'#[가-힣a-zA-Z0-9_]+', '', content)
+        content = _INLINE_HASHTAG_RE.sub('', content)
 
         # 맨 마지막에 해시태그 추가 (5개 이하)
         if hashtags:
@@ -1009,10 +1023,10 @@ class BlogContentGenerator:
         content = '\n'.join(processed_lines)
 
         # 6. 과도한 줄바꿈 정리 (하지만 짧은 문단 유지)
-        content = re.sub(r'\n{4,}', '\n\n\n', content)
+        content = _EXCESS_NEWLINES_RE.sub('\n\n\n', content)
 
         # 7. 검증: 이미지 마커 존재 여부
-        image_markers = re.findall(r'\[사진\d+\]', content)
+        image_markers = _IMAGE_MARKER_RE.findall(content)
         if not image_markers:
             # 마커가 하나도 없으면 경고 플래그 (content 자체는 유지)
             import logging
@@ -1021,7 +1035,7 @@ class BlogContentGenerator:
             )
 
         # 8. 검증: 연속 사진 마커 감지
-        consecutive_pattern = re.findall(r'\[사진\d+\]\s*\n?\s*\[사진\d+\]', content)
+        consecutive_pattern = _CONSECUTIVE_PHOTO_RE.findall(content)
         if consecutive_pattern:
             import logging
             logging.getLogger(__name__).warning(
@@ -1057,12 +1071,12 @@ class BlogContentGenerator:
         ai_expression_count = sum(1 for pattern in ai_patterns if pattern in content)
 
         # 이미지 마커 개수
-        image_markers = re.findall(r'\[사진\d+\]', content)
+        image_markers = _IMAGE_MARKER_RE.findall(content)
         image_marker_count = len(image_markers)
 
         # 연속 사진 여부
         has_consecutive_photos = bool(
-            re.search(r'\[사진\d+\]\s*\n?\s*\[사진\d+\]', content)
+            _CONSECUTIVE_PHOTO_RE.search(content)
         )
 
         # 날조 사실 위험 감지 — 입력에 없는 가격/시간/주차 등을 AI가 단정한 경우
@@ -1070,13 +1084,13 @@ class BlogContentGenerator:
         fabricated_fact_risk = 0
 
         # 가격이 입력에 없는데 본문에 구체적 가격이 있으면 위험
-        if not re.search(r'\d+원', personal_review) and re.search(r'\d+원', content):
+        if not _PRICE_RE.search(personal_review) and _PRICE_RE.search(content):
             fabricated_fact_risk += 1
         # 영업시간이 입력에 없는데 본문에 있으면 위험
-        if not re.search(r'\d+시', personal_review) and re.search(r'\d+시', content):
+        if not _HOUR_RE.search(personal_review) and _HOUR_RE.search(content):
             fabricated_fact_risk += 1
         # 주차가 입력에 없는데 본문에 구체적 주차 언급이 있으면 위험
-        if '주차' not in personal_review and re.search(r'주차\s*(가능|무료|유료|\d+대)', content):
+        if '주차' not in personal_review and _PARKING_DETAIL_RE.search(content):
             fabricated_fact_risk += 1
 
         # quality_score 계산 (새 메트릭 반영)
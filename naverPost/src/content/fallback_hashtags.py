@@ -0,0 +1,55 @@
+"""
+Fallback 해시태그 생성 모듈
+전체 모듈(모델/HashtagGenerator)을 사용할 수 없을 때 쓰는 간단한 규칙 기반 해시태그 생성기입니다.
+표준 라이브러리만 사용하므로 다른 src 모듈의 import 실패와 무관하게 불러올 수 있습니다.
+"""
+
+import re
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import UserDirectInput
+
+# 감상평 키워드 → 해시태그 (우선순위 순) - 정규식은 모듈 로드 시 한 번만 컴파일
+KEYWORD_TAGS = (
+    ("이탈리안", "#이탈리안"),
+    ("파스타", "#파스타"),
+    ("알리오올리오", "#알리오올리오"),
+)
+_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword, _ in KEYWORD_TAGS))
+
+
+def generate_simple_hashtags(user_input: "UserDirectInput", location: Optional[str]) -> Dict[str, List[str]]:
+    """간단한 해시태그 생성 (Fallback)"""
+    candidates = {
+        "category_based": [],
+        "rating_based": [],
+        "companion_based": [],
+        "keyword_based": [],
+        "location_based": []
+    }
+
+    # 카테고리 기반
+    if user_input.category == "맛집":
+        candidates["category_based"] = ["#맛집", "#음식"]
+
+    # 별점 기반
+    if user_input.rating == 5:
+        candidates["rating_based"] = ["#강추", "#최고"]
+    elif user_input.rating == 4:
+        candidates["rating_based"] = ["#추천", "#좋아요"]
+
+    # 동행자 기반
+    if user_input.companion == "가족":
+        candidates["companion_based"] = ["#가족식사"]
+
+    # 간단한 키워드 추출
+    found = set(_KEYWORD_RE.findall(user_input.personal_review))
+    candidates["keyword_based"] = [tag for keyword, tag in KEYWORD_TAGS if keyword in found]
+
+    # 위치 기반 (location이 None이 아닐 때만)
+    if location:
+        if "강남" in location:
+            candidates["location_based"] = ["#강남맛집"]
+
+    return candidates
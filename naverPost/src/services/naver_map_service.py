@@ -76,6 +76,49 @@ class NaverMapService:
             "X-Naver-Client-Secret": self.client_secret
         }
 
+        # 레거시 NCP 호출용 공유 HTTP 세션 (첫 요청 시 생성)
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        레거시 NCP 호출에 공유할 HTTP 세션 반환
+
+        요청마다 ClientSession을 새로 만들면 매번 TCP/TLS 연결을 다시 맺으므로
+        keep-alive 커넥션 풀을 가진 세션 하나를 재사용한다.
+        세션은 이벤트 루프에 묶이므로 루프가 바뀌면 기존 세션을 정리하고 새로 만든다.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_session is None
+            or self._http_session.closed
+            or self._http_session_loop is not loop
+        ):
+            if self._http_session is not None and not self._http_session.closed:
+                await self._close_stale_http_session(self._http_session, self._http_session_loop)
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._http_session_loop = loop
+        return self._http_session
+
+    async def _close_stale_http_session(
+        self, session: aiohttp.ClientSession, session_loop: Optional[asyncio.AbstractEventLoop]
+    ):
+        """이전 이벤트 루프에 묶인 세션 정리 (소켓 누수/Unclosed client session 경고 방지)"""
+        if session_loop is not None and not session_loop.is_closed():
+            # 다른 스레드 등에서 아직 살아 있는 루프의 트랜스포트는 건드리지 않고 세션에서 떼어낸다
+            session.detach()
+            logger.warning("Detached HTTP session bound to another live event loop")
+            return
+
+        try:
+            await session.close()
+        except Exception as e:
+            session.detach()
+            logger.warning("Failed to close stale HTTP session; dropped it", error=e)
+
     async def fetch_place_by_store_name(
         self, store_name: str, region_hint: str = None
     ) -> Optional[Dict[str, Any]]:
@@ -194,23 +237,23 @@ class NaverMapService:
             url = f"{self.base_url}/map-geocode/v2/geocode"
             params = {"query": address}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        if data.get("meta", {}).get("totalCount", 0) > 0:
-                            result = data["addresses"][0]
-                            location = Location(
-                                lat=float(result["y"]),
-                                lng=float(result["x"]),
-                                address=result.get("roadAddress") or result.get("jibunAddress", ""),
-                                name=address
-                            )
-                            logger.info("NCP geocoding successful", address=address)
-                            return location
-                    else:
-                        logger.warning("NCP Geocoding API error", status_code=response.status, address=address)
+            session = await self._get_http_session()
+            async with session.get(url, headers=self.headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+
+                    if data.get("meta", {}).get("totalCount", 0) > 0:
+                        result = data["addresses"][0]
+                        location = Location(
+                            lat=float(result["y"]),
+                            lng=float(result["x"]),
+                            address=result.get("roadAddress") or result.get("jibunAddress", ""),
+                            name=address
+                        )
+                        logger.info("NCP geocoding successful", address=address)
+                        return location
+                else:
+                    logger.warning("NCP Geocoding API error", status_code=response.status, address=address)
 
         except Exception as e:
             logger.error("NCP Geocoding error", error=e, address=address)
@@ -235,23 +278,23 @@ class NaverMapService:
                 "output": "json"
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-
-                        if data["status"]["code"] == 0:
-                            result = data["results"][0]
-                            region = result["region"]
-                            land = result["land"]
-
-                            # 도로명 주소 우선
-                            if land and land["addition0"]["value"]:
-                                return f"{region['area1']['name']} {region['area2']['name']} {land['addition0']['value']}"
-                            else:
-                                return f"{region['area1']['name']} {region['area2']['name']} {region['area3']['name']}"
-                    else:
-                        logger.error(f"Reverse Geocoding API 오류: {response.status}")
+            session = await self._get_http_session()
+            async with session.get(url, headers=self.headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+
+                    if data["status"]["code"] == 0:
+                        result = data["results"][0]
+                        region = result["region"]
+                        land = result["land"]
+
+                        # 도로명 주소 우선
+                        if land and land["addition0"]["value"]:
+                            return f"{region['area1']['name']} {region['area2']['name']} {land['addition0']['value']}"
+                        else:
+                            return f"{region['area1']['name']} {region['area2']['name']} {region['area3']['name']}"
+                else:
+                    logger.error(f"Reverse Geocoding API 오류: {response.status}")
 
         except Exception as e:
             logger.error(f"Reverse Geocoding 중 오류 발생: {e}")
@@ -300,12 +343,12 @@ class NaverMapService:
                 # 기본 마커 추가
                 params["markers"] = f"type:t|size:mid|pos:{location.lng} {location.lat}|color:red"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, params=params) as response:
-                    if response.status == 200:
-                        return await response.read()
-                    else:
-                        logger.error(f"Static Map API 오류: {response.status}")
+            session = await self._get_http_session()
+            async with session.get(url, headers=self.headers, params=params) as response:
+                if response.status == 200:
+                    return await response.read()
+                else:
+                    logger.error(f"Static Map API 오류: {response.status}")
 
         except Exception as e:
             logger.error(f"정적 지도 생성 중 오류 발생: {e}")
@@ -435,6 +478,8 @@ class NaverMapService:
         """리소스 정리"""
         try:
             await self.stabilized_client.close()
+            if self._http_session is not None and not self._http_session.closed:
+                await self._http_session.close()
             logger.info("NaverMapService cleanup completed")
         except Exception as e:
             logger.error("Error during NaverMapService cleanup", error=e)
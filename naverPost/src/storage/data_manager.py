@@ -21,10 +21,18 @@ from src.utils.exceptions import FileProcessingError, DataConsistencyError
 class DateBasedDataManager:
     """날짜 기반 블로그 포스트 데이터 관리 클래스"""
 
-    def __init__(self):
+    def __init__(self, base_dir: Optional[Path] = None):
+        """
+        Args:
+            base_dir: 베이스 데이터 디렉토리 (기본: Settings.DATA_DIR, 전역 date_manager 공유)
+        """
         self.settings = Settings
-        self.date_manager = date_manager
-        self._ensure_base_directories()
+        if base_dir:
+            # 격리된 디렉토리는 DateBasedDirectoryManager가 생성 (Settings 디렉토리는 건드리지 않음)
+            self.date_manager = DateBasedDirectoryManager(base_dir)
+        else:
+            self.date_manager = date_manager
+            self._ensure_base_directories()
 
     def _ensure_base_directories(self):
         """기본 디렉토리 생성"""
@@ -259,7 +267,7 @@ class DateBasedDataManager:
             # 실패 시 정리 작업
             if temp_session_committed:
                 # 임시 세션을 커밋한 경우 - 생성된 디렉토리 삭제
-                base_path = self.settings.DATA_DIR / resolved_dir_name
+                base_path = self.date_manager.base_dir / resolved_dir_name
                 if base_path.exists():
                     try:
                         shutil.rmtree(base_path)
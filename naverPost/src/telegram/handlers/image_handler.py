@@ -27,6 +27,10 @@ from src.utils.exceptions import (
 )
 from src.utils.structured_logger import get_logger
 
+# 도/분/초 → 십진수 변환용 역수 (나눗셈 대신 곱셈)
+_INV_60 = 1.0 / 60.0
+_INV_3600 = 1.0 / 3600.0
+
 
 class ImageHandler(SafeMessageMixin):
     """텔레그램 이미지 처리 핸들러 (안정화 버전)"""
@@ -321,7 +325,7 @@ class ImageHandler(SafeMessageMixin):
             minutes = float(coordinate[1])
             seconds = float(coordinate[2])
 
-            decimal = degrees + minutes/60 + seconds/3600
+            decimal = degrees + minutes * _INV_60 + seconds * _INV_3600
 
             # 남위나 서경인 경우 음수로 변환
             if reference in ['S', 'W']:
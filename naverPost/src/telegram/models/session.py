@@ -128,10 +128,7 @@ def create_session(user_id: int) -> TelegramSession:
 
 def delete_session(user_id: int) -> bool:
     """세션 삭제"""
-    if user_id in active_sessions:
-        del active_sessions[user_id]
-        return True
-    return False
+    return active_sessions.pop(user_id, None) is not None
 
 
 def cleanup_expired_sessions(timeout_seconds: int = None) -> int:
@@ -17,6 +17,28 @@ from .handlers.image_handler import ImageHandler
 from .utils import get_user_logger
 
 
+# 진행상황 콜백에서 매 이벤트마다 다시 만들지 않도록 모듈 레벨에 둔다
+_WORKFLOW_STATUS_EMOJI = {
+    WorkflowStatus.VALIDATING: "🔍",
+    WorkflowStatus.GENERATING_BLOG: "🤖",
+    WorkflowStatus.QUALITY_CHECKING: "📊",
+    WorkflowStatus.UPLOADING_TO_NAVER: "📤",
+    WorkflowStatus.COMPLETED: "✅",
+    WorkflowStatus.FAILED: "❌",
+    WorkflowStatus.CANCELLED: "⏹️"
+}
+
+_WORKFLOW_STATUS_NAMES = {
+    WorkflowStatus.VALIDATING: "검증",
+    WorkflowStatus.GENERATING_BLOG: "생성",
+    WorkflowStatus.QUALITY_CHECKING: "품질검사",
+    WorkflowStatus.UPLOADING_TO_NAVER: "업로드",
+    WorkflowStatus.COMPLETED: "완료",
+    WorkflowStatus.FAILED: "실패",
+    WorkflowStatus.CANCELLED: "취소"
+}
+
+
 class BlogGenerationService:
     """블로그 생성 서비스"""
 
@@ -68,15 +90,7 @@ class BlogGenerationService:
             # 진행상황 콜백 정의
             async def progress_callback(progress: WorkflowProgress):
                 """진행상황을 텔레그램으로 전송하고 로깅"""
-                status_emoji = {
-                    WorkflowStatus.VALIDATING: "🔍",
-                    WorkflowStatus.GENERATING_BLOG: "🤖",
-                    WorkflowStatus.QUALITY_CHECKING: "📊",
-                    WorkflowStatus.UPLOADING_TO_NAVER: "📤",
-                    WorkflowStatus.COMPLETED: "✅",
-                    WorkflowStatus.FAILED: "❌",
-                    WorkflowStatus.CANCELLED: "⏹️"
-                }.get(progress.status, "⏳")
+                status_emoji = _WORKFLOW_STATUS_EMOJI.get(progress.status, "⏳")
 
                 progress_msg = (
                     f"{status_emoji} **{progress.step_name}** ({progress.current_step}/{progress.total_steps})\n"
@@ -85,15 +99,7 @@ class BlogGenerationService:
                 )
 
                 # 워크플로우 단계별 로깅
-                status_name = {
-                    WorkflowStatus.VALIDATING: "검증",
-                    WorkflowStatus.GENERATING_BLOG: "생성",
-                    WorkflowStatus.QUALITY_CHECKING: "품질검사",
-                    WorkflowStatus.UPLOADING_TO_NAVER: "업로드",
-                    WorkflowStatus.COMPLETED: "완료",
-                    WorkflowStatus.FAILED: "실패",
-                    WorkflowStatus.CANCELLED: "취소"
-                }.get(progress.status, progress.status.value)
+                status_name = _WORKFLOW_STATUS_NAMES.get(progress.status, progress.status.value)
 
                 user_logger.log_workflow_step(
                     step_name=progress.step_name,
@@ -5,6 +5,9 @@ Input validation utilities
 from typing import Optional
 from datetime import datetime
 
+# '오늘'로 처리할 입력 키워드
+_TODAY_KEYWORDS = frozenset({'오늘', 'today'})
+
 
 class DateValidator:
     """날짜 검증 관련 기능"""
@@ -23,7 +26,7 @@ class DateValidator:
         text = text.strip().lower()
 
         # '오늘' 또는 'today' 처리
-        if text in ['오늘', 'today']:
+        if text in _TODAY_KEYWORDS:
             return datetime.now().strftime('%Y%m%d')
 
         # YYYYMMDD 형식 검증
@@ -8,12 +8,108 @@
 import json
 from pathlib import Path
 from datetime import datetime, date
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from functools import lru_cache
 import logging
 import re
 
 from src.config.settings import Settings
 
+# 모듈 로드 시 한 번만 컴파일하는 정규식
+_DATE_RE = re.compile(r'^\d{8}$')
+_UNSAFE_NAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NUMERIC_RE = re.compile(r'^\d+(\.\d+)?$')
+_HASHTAG_NAME_RE = re.compile(r'#([가-힣A-Za-z0-9][가-힣A-Za-z0-9\s]{1,20})')
+# "○○○ 레스토랑", "○○○ 카페" 등 AI 스크립트의 상호명 패턴
+_AI_SCRIPT_BUSINESS_PATTERNS = (
+    re.compile(r'([가-힣]+)\s*(?:레스토랑|카페|식당|상회|음식점|매장|가게)'),
+    re.compile(r'([가-힣A-Za-z]+)\s*(?:Restaurant|Cafe|Store)'),
+    re.compile(r'이름은\s*([가-힣A-Za-z]+)'),
+    re.compile(r'([가-힣A-Za-z]{2,8})에서'),  # "○○○에서" 패턴
+)
+# 개인 리뷰의 상호명 패턴
+_REVIEW_BUSINESS_PATTERNS = (
+    re.compile(r'([가-힣]{2,8})\s*(?:에서|에|은|는|이|가)\s'),
+    re.compile(r'([가-힣A-Za-z]{2,8})\s*(?:라는|이라는)\s*(?:곳|가게|식당)'),
+)
+# 날짜 디렉토리명 (기존 yyyyMMdd[_N] / 새 yyyyMMdd(상호명)[_N] / 과거 yyyyMMdd_N(상호명))
+_DATE_DIRECTORY_RE = re.compile(r'^\d{8}(?:(?:_\d+)?|\([^)]+\)(?:_\d+)?|_\d+\([^)]+\))$')
+
+# 명시적 상호명 필드 (우선순위 순)
+_EXPLICIT_BUSINESS_NAME_FIELDS = (
+    "resolved_store_name",
+    "store_name",
+    "place_name",
+    "business_name",
+    "store",
+    "place",
+)
+
+
+def _sanitize_business_name(name: str) -> str:
+    """디렉토리명에 안전한 상호명으로 정규화"""
+    cleaned = _UNSAFE_NAME_CHARS_RE.sub('', (name or '').strip())
+    cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
+    return cleaned
+
+
+def _text_or_empty(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+@lru_cache(maxsize=256)
+def _extract_business_name_cached(
+    explicit_values: Tuple[Optional[str], ...],
+    location: Optional[str],
+    hashtags: Tuple[str, ...],
+    ai_script: str,
+    personal_review: str,
+) -> str:
+    """정규화된 입력에서 상호명 추출 (재시도/미리보기 등 동일 입력은 캐시 적중)"""
+    # 0. 명시적 상호명 필드 우선
+    for value in explicit_values:
+        if value is not None:
+            clean = _sanitize_business_name(value)
+            if len(clean) >= 2:
+                return clean
+
+    # location이 문자열 주소/상호명으로 들어오는 경우
+    if location is not None:
+        clean_location = _sanitize_business_name(location)
+        if clean_location and not _NUMERIC_RE.match(clean_location):
+            return clean_location
+
+    # 해시태그에서 상호명 추출 시도
+    for tag in hashtags:
+        for m in _HASHTAG_NAME_RE.findall(tag):
+            candidate = _sanitize_business_name(m)
+            if len(candidate) >= 2:
+                return candidate
+
+    # 1. AI 스크립트에서 상호명 추출 시도
+    if ai_script:
+        # "○○○ 레스토랑", "○○○ 카페" 등의 패턴 찾기
+        for pattern in _AI_SCRIPT_BUSINESS_PATTERNS:
+            match = pattern.search(ai_script)
+            if match:
+                name = _sanitize_business_name(match.group(1))
+                if len(name) >= 2 and name not in ['서울', '강남', '홍대', '명동']:
+                    return name
+
+    # 2. 개인 리뷰에서 상호명 추출 시도
+    if personal_review:
+        # 개인 리뷰에서 상호명 패턴 찾기
+        for pattern in _REVIEW_BUSINESS_PATTERNS:
+            match = pattern.search(personal_review)
+            if match:
+                name = _sanitize_business_name(match.group(1))
+                if len(name) >= 2 and name not in ['음식', '분위기', '직원', '가격', '서비스']:
+                    return name
+
+    # 3. 상호명을 찾지 못한 경우에도 괄호 구조를 유지
+    return "상호미입력"
+
 
 class DateBasedDirectoryManager:
     """날짜 기반 디렉토리 관리 클래스"""
@@ -42,7 +138,7 @@ class DateBasedDirectoryManager:
 
     def _validate_date_format(self, date_str: str) -> bool:
         """날짜 형식 유효성 검사 (yyyyMMdd)"""
-        if not re.match(r'^\d{8}$', date_str):
+        if not _DATE_RE.match(date_str):
             return False
 
         try:
@@ -53,83 +149,25 @@ class DateBasedDirectoryManager:
 
     def _sanitize_business_name(self, name: str) -> str:
         """디렉토리명에 안전한 상호명으로 정규화"""
-        cleaned = re.sub(r'[<>:"/\\|?*]', '', (name or '').strip())
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        return cleaned
+        return _sanitize_business_name(name)
 
     def _extract_business_name_from_input(self, user_input: Dict[str, Any]) -> str:
-        """사용자 입력에서 상호명 추출"""
+        """사용자 입력에서 상호명 추출 (동일 입력 재처리 시 캐시된 결과 사용)"""
         try:
-            # 0. 명시적 상호명 필드 우선
-            explicit_fields = [
-                "resolved_store_name",
-                "store_name",
-                "place_name",
-                "business_name",
-                "store",
-                "place",
-            ]
-            for key in explicit_fields:
-                value = user_input.get(key)
-                if isinstance(value, str):
-                    clean = self._sanitize_business_name(value)
-                    if len(clean) >= 2:
-                        return clean
-
-            # location이 문자열 주소/상호명으로 들어오는 경우
+            # 추출에 쓰이는 필드만 해시 가능한 키로 정규화
+            explicit_values = tuple(
+                value if isinstance(value, str) else None
+                for value in (user_input.get(key) for key in _EXPLICIT_BUSINESS_NAME_FIELDS)
+            )
             location = user_input.get("location")
-            if isinstance(location, str):
-                clean_location = self._sanitize_business_name(location)
-                if clean_location and not re.match(r'^\d+(\.\d+)?$', clean_location):
-                    return clean_location
-
-            # 해시태그에서 상호명 추출 시도
             hashtags = user_input.get("hashtags", [])
-            if isinstance(hashtags, list):
-                for tag in hashtags:
-                    if not isinstance(tag, str):
-                        continue
-                    for m in re.findall(r'#([가-힣A-Za-z0-9][가-힣A-Za-z0-9\s]{1,20})', tag):
-                        candidate = self._sanitize_business_name(m)
-                        if len(candidate) >= 2:
-                            return candidate
-
-            # 1. AI 스크립트에서 상호명 추출 시도
-            ai_script = user_input.get("ai_additional_script", "")
-            if ai_script:
-                # "○○○ 레스토랑", "○○○ 카페" 등의 패턴 찾기
-                business_patterns = [
-                    r'([가-힣]+)\s*(?:레스토랑|카페|식당|상회|음식점|매장|가게)',
-                    r'([가-힣A-Za-z]+)\s*(?:Restaurant|Cafe|Store)',
-                    r'이름은\s*([가-힣A-Za-z]+)',
-                    r'([가-힣A-Za-z]{2,8})에서',  # "○○○에서" 패턴
-                ]
-
-                for pattern in business_patterns:
-                    match = re.search(pattern, ai_script)
-                    if match:
-                        name = self._sanitize_business_name(match.group(1))
-                        if len(name) >= 2 and name not in ['서울', '강남', '홍대', '명동']:
-                            return name
-
-            # 2. 개인 리뷰에서 상호명 추출 시도
-            personal_review = user_input.get("personal_review", "")
-            if personal_review:
-                # 개인 리뷰에서 상호명 패턴 찾기
-                review_patterns = [
-                    r'([가-힣]{2,8})\s*(?:에서|에|은|는|이|가)\s',
-                    r'([가-힣A-Za-z]{2,8})\s*(?:라는|이라는)\s*(?:곳|가게|식당)',
-                ]
-
-                for pattern in review_patterns:
-                    match = re.search(pattern, personal_review)
-                    if match:
-                        name = self._sanitize_business_name(match.group(1))
-                        if len(name) >= 2 and name not in ['음식', '분위기', '직원', '가격', '서비스']:
-                            return name
-
-            # 3. 상호명을 찾지 못한 경우에도 괄호 구조를 유지
-            return "상호미입력"
+            return _extract_business_name_cached(
+                explicit_values,
+                location if isinstance(location, str) else None,
+                tuple(tag for tag in hashtags if isinstance(tag, str)) if isinstance(hashtags, list) else (),
+                _text_or_empty(user_input.get("ai_additional_script", "")),
+                _text_or_empty(user_input.get("personal_review", "")),
+            )
 
         except Exception as e:
             logging.warning(f"Error extracting business name: {e}")
@@ -640,19 +678,11 @@ date_directory: {dir_path.name}
         # 기존 형식: yyyyMMdd, yyyyMMdd_N
         # 새 형식: yyyyMMdd(상호명), yyyyMMdd(상호명)_N
         # 과거 형식: yyyyMMdd_N(상호명)
-        patterns = [
-            r'^\d{8}(_\d+)?$',                    # 기존 형식
-            r'^\d{8}\([^)]+\)(?:_\d+)?$',         # 새 형식
-            r'^\d{8}_\d+\([^)]+\)$'               # 과거 형식
-        ]
         directories = []
 
         for path in self.base_dir.iterdir():
-            if path.is_dir():
-                for pattern in patterns:
-                    if re.match(pattern, path.name):
-                        directories.append(path.name)
-                        break
+            if path.is_dir() and _DATE_DIRECTORY_RE.match(path.name):
+                directories.append(path.name)
 
         return sorted(directories)
 
@@ -29,6 +29,7 @@ class _CacheEntry:
 
 
 _DNS_CACHE: Dict[str, _CacheEntry] = {}
+_DNS_CACHE_MAX_TTL = 300  # 5 min cache cap; shorter record TTLs win
 _LOG = logging.getLogger(__name__)
 _DEFAULT_TELEGRAM_API_IPS = [
     "149.154.167.220",
@@ -57,7 +58,8 @@ def _skip_name(packet: bytes, offset: int) -> int:
         offset += 1 + length
 
 
-def _query_dns_a(host: str, server: str, timeout_s: float = 1.5) -> List[str]:
+def _query_dns_a(host: str, server: str, timeout_s: float = 1.5) -> Tuple[List[str], int]:
+    """Return (A-record IPs, minimum record TTL) for host from a single DNS server."""
     txid = random.getrandbits(16)
     flags = 0x0100  # standard query, recursion desired
     qdcount = 1
@@ -74,23 +76,24 @@ def _query_dns_a(host: str, server: str, timeout_s: float = 1.5) -> List[str]:
         sock.close()
 
     if len(data) < 12:
-        return []
+        return [], 0
 
     resp_txid, resp_flags, qd, an, _, _ = struct.unpack("!HHHHHH", data[:12])
     if resp_txid != txid:
-        return []
+        return [], 0
     rcode = resp_flags & 0x000F
     if rcode != 0 or an == 0:
-        return []
+        return [], 0
 
     offset = 12
     for _ in range(qd):
         offset = _skip_name(data, offset)
         offset += 4  # qtype + qclass
         if offset > len(data):
-            return []
+            return [], 0
 
     ips: List[str] = []
+    min_ttl = _DNS_CACHE_MAX_TTL
     for _ in range(an):
         offset = _skip_name(data, offset)
         if offset + 10 > len(data):
@@ -104,20 +107,22 @@ def _query_dns_a(host: str, server: str, timeout_s: float = 1.5) -> List[str]:
 
         if rtype == 1 and rclass == 1 and rdlength == 4:
             ips.append(socket.inet_ntoa(rdata))
+            min_ttl = min(min_ttl, ttl)
 
-    return ips
+    return ips, min_ttl
 
 
 def _resolve_with_public_dns(host: str, dns_servers: Sequence[str]) -> List[str]:
-    now = time.time()
+    now = time.monotonic()
     cached = _DNS_CACHE.get(host)
     if cached and cached.expire_at > now:
         return list(cached.ips)
 
     all_ips: List[str] = []
+    ttl = _DNS_CACHE_MAX_TTL
     for server in dns_servers:
         try:
-            ips = _query_dns_a(host, server)
+            ips, ttl = _query_dns_a(host, server)
             for ip in ips:
                 if ip not in all_ips:
                     all_ips.append(ip)
@@ -126,8 +131,8 @@ def _resolve_with_public_dns(host: str, dns_servers: Sequence[str]) -> List[str]
         except Exception:
             continue
 
-    if all_ips:
-        _DNS_CACHE[host] = _CacheEntry(all_ips, now + 300)  # 5 min cache
+    if all_ips and ttl > 0:
+        _DNS_CACHE[host] = _CacheEntry(all_ips, now + ttl)
     return all_ips
 
 
@@ -189,10 +194,13 @@ def install_dns_fallback(
                 if not ips:
                     raise
 
+                # IPs are literals here; AI_NUMERICHOST keeps getaddrinfo from
+                # going back to the (failing) system resolver for them.
+                numeric_flags = flags | socket.AI_NUMERICHOST
                 results = []
                 for ip in ips:
                     try:
-                        resolved = original(ip, port, socket.AF_INET, type, proto, flags)
+                        resolved = original(ip, port, socket.AF_INET, type, proto, numeric_flags)
                         results.extend(resolved)
                     except socket.gaierror:
                         continue
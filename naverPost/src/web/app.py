@@ -98,6 +98,13 @@ async def lifespan(app: FastAPI):
     # Shutdown
     web_logger.info("🛑 Shutting down Naver Blog Automation System")
 
+    # /api/map 라우트가 공유하는 지도 서비스의 HTTP 세션 정리
+    try:
+        from src.services.naver_map_service import naver_map_service
+        await naver_map_service.cleanup()
+    except Exception as e:
+        web_logger.warning(f"Naver map service cleanup failed (non-critical): {e}")
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="네이버 블로그 포스팅 자동화 시스템",
@@ -323,9 +323,11 @@ async def calculate_distance(
         Dict: 거리 정보
     """
     try:
-        # 두 주소를 좌표로 변환
-        from_location = await get_location_from_address(from_address)
-        to_location = await get_location_from_address(to_address)
+        # 두 주소를 좌표로 변환 (서로 독립적이므로 동시에 요청)
+        from_location, to_location = await asyncio.gather(
+            get_location_from_address(from_address),
+            get_location_from_address(to_address)
+        )
 
         if not from_location:
             raise HTTPException(status_code=404, detail=f"출발지 주소 '{from_address}'를 찾을 수 없습니다.")
@@ -366,13 +368,25 @@ async def test_all_features():
     """모든 네이버 지도 API 기능 테스트"""
     try:
         test_results = {}
+        test_address = "서울특별시 중구 세종대로 110"
+
+        async def geocode_then_reverse():
+            location = await get_location_from_address(test_address)
+            if not location:
+                return None, None
+            return location, await get_address_from_coordinates(location.lat, location.lng)
+
+        # 서로 독립적인 검사는 동시에 실행 (Geocoding → Reverse Geocoding만 순차)
+        api_validation, (location, reverse_address), places = await asyncio.gather(
+            naver_map_service.validate_api_keys(),
+            geocode_then_reverse(),
+            naver_map_service.search_places("강남역 맛집")
+        )
 
         # 1. API 키 검증
-        test_results["api_validation"] = await naver_map_service.validate_api_keys()
+        test_results["api_validation"] = api_validation
 
         # 2. Geocoding 테스트
-        test_address = "서울특별시 중구 세종대로 110"
-        location = await get_location_from_address(test_address)
         test_results["geocoding"] = {
             "success": location is not None,
             "location": LocationResponse(
@@ -385,14 +399,12 @@ async def test_all_features():
 
         # 3. Reverse Geocoding 테스트
         if location:
-            reverse_address = await get_address_from_coordinates(location.lat, location.lng)
             test_results["reverse_geocoding"] = {
                 "success": reverse_address is not None,
                 "address": reverse_address
             }
 
         # 4. 장소 검색 테스트
-        places = await naver_map_service.search_places("강남역 맛집")
         test_results["place_search"] = {
             "success": len(places) > 0,
             "count": len(places),
@@ -2,423 +2,174 @@
 """
 Comprehensive regression tests for the Naver blog system refactoring
 Tests backward compatibility and core functionality
+
+Run with pytest (in parallel via pytest-xdist):
+    pytest test_refactoring_regression.py -n auto
+    pytest test_refactoring_regression.py -m phase1
+    pytest test_refactoring_regression.py -rA        # per-test result summary
 """
 
-import sys
-import asyncio
-import logging
+import importlib.machinery
 from pathlib import Path
-from typing import Dict, Any, List
 
-# Add project root to Python path
+import pytest
+
+# sys.path 설정은 conftest.py에서 한 번만 수행
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
-# Set up basic logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-
-class RegressionTestSuite:
-    """Comprehensive regression test suite"""
-
-    def __init__(self):
-        self.test_results = []
-        self.passed = 0
-        self.failed = 0
-
-    def test_result(self, test_name: str, success: bool, message: str = ""):
-        """Record test result"""
-        status = "✅ PASS" if success else "❌ FAIL"
-        result = {
-            'name': test_name,
-            'success': success,
-            'message': message,
-            'status': status
-        }
-        self.test_results.append(result)
-
-        if success:
-            self.passed += 1
-        else:
-            self.failed += 1
-
-        print(f"{status}: {test_name}" + (f" - {message}" if message else ""))
-
-    # Phase 1 Tests: Blog Workflow Refactoring
-    def test_blog_workflow_imports(self):
-        """Test that refactored blog workflow components can be imported"""
-        try:
-            from src.services.blog_workflow import BlogWorkflowService
-            self.test_result("Blog workflow service import", True)
-        except Exception as e:
-            self.test_result("Blog workflow service import", False, str(e))
-            return
-
-        try:
-            from src.services.quality import BlogQualityVerifier, RetryManager, QualityThresholdManager
-            self.test_result("Quality services import", True)
-        except Exception as e:
-            self.test_result("Quality services import", False, str(e))
-
-        try:
-            from src.services.generation import BlogContentManager
-            self.test_result("Generation services import", True)
-        except Exception as e:
-            self.test_result("Generation services import", False, str(e))
-
-        try:
-            from src.services.browser import BrowserSessionManager, BrowserCleanupService
-            self.test_result("Browser services import", True)
-        except Exception as e:
-            self.test_result("Browser services import", False, str(e))
-
-    def test_blog_workflow_initialization(self):
-        """Test that BlogWorkflowService can be initialized with new components"""
-        try:
-            from src.services.blog_workflow import BlogWorkflowService
-            service = BlogWorkflowService()
-
-            # Check that new components are initialized
-            if hasattr(service, 'quality_verifier'):
-                self.test_result("Quality verifier initialization", True)
-            else:
-                self.test_result("Quality verifier initialization", False, "Missing quality_verifier attribute")
-
-            if hasattr(service, 'content_manager'):
-                self.test_result("Content manager initialization", True)
-            else:
-                self.test_result("Content manager initialization", False, "Missing content_manager attribute")
-
-            if hasattr(service, 'browser_cleanup_service'):
-                self.test_result("Browser cleanup service initialization", True)
-            else:
-                self.test_result("Browser cleanup service initialization", False, "Missing browser_cleanup_service attribute")
-
-        except Exception as e:
-            self.test_result("Blog workflow initialization", False, str(e))
-
-    def test_quality_threshold_manager(self):
-        """Test quality threshold management"""
-        try:
-            from src.services.quality import QualityThresholdManager
-            from src.config.settings import Settings
-
-            threshold_manager = QualityThresholdManager(Settings)
-
-            # Test threshold evaluation
-            result = threshold_manager.evaluate_quality_score(0.8)
-            if result['passes_threshold']:
-                self.test_result("Quality threshold evaluation (high score)", True)
-            else:
-                self.test_result("Quality threshold evaluation (high score)", False, "High score should pass")
-
-            result = threshold_manager.evaluate_quality_score(0.5)
-            if not result['passes_threshold']:
-                self.test_result("Quality threshold evaluation (low score)", True)
-            else:
-                self.test_result("Quality threshold evaluation (low score)", False, "Low score should fail")
-
-        except Exception as e:
-            self.test_result("Quality threshold manager", False, str(e))
-
-    # Phase 2 Tests: Telegram Bot Logic Refactoring
-    def test_telegram_import_resolution(self):
-        """Test that Telegram import conflicts are resolved"""
-        try:
-            # Test that utils.py is removed
-            utils_py_path = Path("src/telegram/utils.py")
-            if utils_py_path.exists():
-                self.test_result("Telegram utils.py removal", False, "utils.py still exists")
-            else:
-                self.test_result("Telegram utils.py removal", True)
-        except Exception as e:
-            self.test_result("Telegram utils.py removal", False, str(e))
-
-        # Test imports from utils directory work (skip if telegram not installed)
-        try:
-            from src.telegram.utils.validators import DateValidator
-            from src.telegram.utils.formatters import ProgressSummaryBuilder
-            self.test_result("Telegram utils directory imports", True)
-        except ImportError as e:
-            if "telegram" in str(e).lower():
-                self.test_result("Telegram utils directory imports", True, "Skipped - telegram not installed")
-            else:
-                self.test_result("Telegram utils directory imports", False, str(e))
-        except Exception as e:
-            self.test_result("Telegram utils directory imports", False, str(e))
-
-    def test_safe_message_mixin(self):
-        """Test safe message mixin functionality"""
-        try:
-            from src.config.settings import Settings
-
-            # Test that USE_SAFE_MESSAGING setting exists
-            safe_messaging_enabled = getattr(Settings, 'USE_SAFE_MESSAGING', None)
-            if safe_messaging_enabled is not None:
-                self.test_result("USE_SAFE_MESSAGING setting", True, f"Value: {safe_messaging_enabled}")
-            else:
-                self.test_result("USE_SAFE_MESSAGING setting", False, "Setting not found")
-                return
-
-            # Test mixin import (skip if telegram not installed)
-            try:
-                from src.telegram.utils.safe_message_mixin import SafeMessageMixin
-
-                # Test mixin can be instantiated
-                class TestHandler(SafeMessageMixin):
-                    pass
-
-                handler = TestHandler()
-                if hasattr(handler, 'safe_reply_text'):
-                    self.test_result("Safe message mixin methods", True)
-                else:
-                    self.test_result("Safe message mixin methods", False, "Missing safe_reply_text method")
-
-            except ImportError as e:
-                if "telegram" in str(e).lower():
-                    self.test_result("Safe message mixin methods", True, "Skipped - telegram not installed")
-                else:
-                    self.test_result("Safe message mixin methods", False, str(e))
-
-        except Exception as e:
-            self.test_result("Safe message mixin", False, str(e))
-
-    def test_conversation_handler_refactoring(self):
-        """Test conversation handler state decomposition"""
-        try:
-            # Test state handlers import (skip if telegram not installed)
-            try:
-                from src.telegram.handlers.states import (
-                    DateInputHandler, CategorySelectionHandler,
-                    StoreNameHandler, ReviewInputHandler
-                )
-                self.test_result("State handlers import", True)
-
-                # Test that main conversation handler uses state handlers
-                from src.telegram.handlers.conversation import ConversationHandler
-
-                # Create a fake bot for testing
-                class FakeBot:
-                    pass
-
-                handler = ConversationHandler(FakeBot())
-
-                # Check that state handlers are initialized
-                state_handlers = ['date_handler', 'category_handler', 'store_handler', 'review_handler']
-                all_present = all(hasattr(handler, attr) for attr in state_handlers)
-
-                if all_present:
-                    self.test_result("Conversation handler state delegation", True)
-                else:
-                    missing = [attr for attr in state_handlers if not hasattr(handler, attr)]
-                    self.test_result("Conversation handler state delegation", False, f"Missing: {missing}")
-
-            except ImportError as e:
-                if "telegram" in str(e).lower():
-                    self.test_result("Conversation handler refactoring", True, "Skipped - telegram not installed")
-                else:
-                    self.test_result("Conversation handler refactoring", False, str(e))
-
-        except Exception as e:
-            self.test_result("Conversation handler refactoring", False, str(e))
-
-    # Phase 3 Tests: Startup Script Consolidation
-    def test_telegram_service_unification(self):
-        """Test unified telegram service"""
-        try:
-            from src.services.telegram_service import TelegramBotService, get_telegram_service
-
-            # Test service creation
-            service = get_telegram_service()
-            if isinstance(service, TelegramBotService):
-                self.test_result("Telegram service creation", True)
-            else:
-                self.test_result("Telegram service creation", False, "Wrong service type")
-
-            # Test configuration methods
-            required_methods = ['_validate_configuration', '_install_dns_fallback', 'run', 'run_once']
-            missing_methods = [method for method in required_methods if not hasattr(service, method)]
-
-            if not missing_methods:
-                self.test_result("Telegram service methods", True)
-            else:
-                self.test_result("Telegram service methods", False, f"Missing: {missing_methods}")
-
-        except Exception as e:
-            self.test_result("Telegram service unification", False, str(e))
-
-    def test_improved_process_management(self):
-        """Test improved process management features"""
-        try:
-            from src.services.telegram_service import TelegramBotService
-
-            service = TelegramBotService(exponential_backoff=True, base_retry_delay=5)
-
-            # Test exponential backoff calculation
-            delay1 = service._calculate_retry_delay(1)
-            delay2 = service._calculate_retry_delay(2)
-            delay3 = service._calculate_retry_delay(3)
-
-            if delay1 < delay2 < delay3:
-                self.test_result("Exponential backoff calculation", True, f"Delays: {delay1}, {delay2}, {delay3}")
-            else:
-                self.test_result("Exponential backoff calculation", False, f"Delays not increasing: {delay1}, {delay2}, {delay3}")
-
-            # Test graceful shutdown methods
-            shutdown_methods = ['_setup_signal_handlers', '_perform_graceful_shutdown', 'add_shutdown_handler']
-            missing = [method for method in shutdown_methods if not hasattr(service, method)]
-
-            if not missing:
-                self.test_result("Graceful shutdown methods", True)
-            else:
-                self.test_result("Graceful shutdown methods", False, f"Missing: {missing}")
-
-        except Exception as e:
-            self.test_result("Process management improvements", False, str(e))
-
-    def test_systemd_service_files(self):
-        """Test systemd service configuration"""
-        try:
-            service_file = Path("scripts/naverpost-bot.service")
-            install_script = Path("scripts/install-systemd-service.sh")
-
-            if service_file.exists():
-                self.test_result("Systemd service file exists", True)
-
-                # Check service file content
-                content = service_file.read_text()
-                required_sections = ['[Unit]', '[Service]', '[Install]']
-                missing_sections = [section for section in required_sections if section not in content]
-
-                if not missing_sections:
-                    self.test_result("Systemd service file structure", True)
-                else:
-                    self.test_result("Systemd service file structure", False, f"Missing: {missing_sections}")
-            else:
-                self.test_result("Systemd service file exists", False)
-
-            if install_script.exists() and install_script.stat().st_mode & 0o111:
-                self.test_result("Install script exists and executable", True)
-            else:
-                self.test_result("Install script exists and executable", False)
-
-        except Exception as e:
-            self.test_result("Systemd service files", False, str(e))
-
-    # Integration Tests
-    async def test_blog_workflow_integration(self):
-        """Test that blog workflow integration still works"""
-        try:
-            from src.services.blog_workflow import get_blog_workflow_service
-
-            service = get_blog_workflow_service()
-
-            # Test that all components are present and functional
-            if hasattr(service, 'quality_verifier') and hasattr(service, 'content_manager'):
-                self.test_result("Blog workflow integration", True, "All components present")
-            else:
-                missing = []
-                if not hasattr(service, 'quality_verifier'):
-                    missing.append('quality_verifier')
-                if not hasattr(service, 'content_manager'):
-                    missing.append('content_manager')
-                self.test_result("Blog workflow integration", False, f"Missing: {missing}")
-
-        except Exception as e:
-            self.test_result("Blog workflow integration", False, str(e))
-
-    def test_telegram_bot_integration(self):
-        """Test that Telegram bot can still be imported and initialized"""
-        try:
-            from src.telegram.bot import NaverPostTelegramBot
-
-            # Try to create bot instance (this will test all imports)
-            # We won't actually run it to avoid requiring real tokens
-            bot_class = NaverPostTelegramBot
-
-            # Check that required attributes/methods exist
-            required_methods = ['run', '__init__']
-            class_dict = bot_class.__dict__
-
-            missing = [method for method in required_methods if method not in class_dict]
-            if not missing:
-                self.test_result("Telegram bot class structure", True)
-            else:
-                self.test_result("Telegram bot class structure", False, f"Missing: {missing}")
-
-        except ImportError as e:
-            if "telegram" in str(e).lower():
-                self.test_result("Telegram bot integration", True, "Skipped - telegram not installed")
-            else:
-                self.test_result("Telegram bot integration", False, str(e))
-        except Exception as e:
-            self.test_result("Telegram bot integration", False, str(e))
-
-    def run_all_tests(self):
-        """Run all regression tests"""
-        print("🧪 Running comprehensive regression tests for Naver blog system refactoring...\n")
-
-        # Phase 1: Blog Workflow Refactoring Tests
-        print("📊 Phase 1: Blog Workflow Refactoring Tests")
-        print("-" * 50)
-        self.test_blog_workflow_imports()
-        self.test_blog_workflow_initialization()
-        self.test_quality_threshold_manager()
-        print()
-
-        # Phase 2: Telegram Bot Logic Refactoring Tests
-        print("💬 Phase 2: Telegram Bot Logic Refactoring Tests")
-        print("-" * 50)
-        self.test_telegram_import_resolution()
-        self.test_safe_message_mixin()
-        self.test_conversation_handler_refactoring()
-        print()
-
-        # Phase 3: Startup Script Consolidation Tests
-        print("🚀 Phase 3: Startup Script Consolidation Tests")
-        print("-" * 50)
-        self.test_telegram_service_unification()
-        self.test_improved_process_management()
-        self.test_systemd_service_files()
-        print()
-
-        # Integration Tests
-        print("🔗 Integration Tests")
-        print("-" * 50)
-        asyncio.run(self.test_blog_workflow_integration())
-        self.test_telegram_bot_integration()
-        print()
-
-        # Summary
-        print("📋 Test Summary")
-        print("=" * 50)
-        print(f"Total tests: {self.passed + self.failed}")
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        print(f"Success rate: {(self.passed / (self.passed + self.failed) * 100):.1f}%" if (self.passed + self.failed) > 0 else "No tests run")
-
-        if self.failed > 0:
-            print("\n🔍 Failed tests:")
-            for result in self.test_results:
-                if not result['success']:
-                    print(f"   - {result['name']}: {result['message']}")
-
-        return self.failed == 0
-
-
-def main():
-    """Main test runner"""
-    test_suite = RegressionTestSuite()
-    success = test_suite.run_all_tests()
-
-    if success:
-        print("\n🎉 All regression tests passed! The refactoring maintains backward compatibility.")
-        return 0
-    else:
-        print(f"\n⚠️ {test_suite.failed} regression tests failed. Please review the issues above.")
-        return 1
-
-
-if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+
+
+# Phase 1 Tests: Blog Workflow Refactoring
+@pytest.mark.phase1
+@pytest.mark.parametrize("module_name", ['blog_workflow', 'quality', 'generation', 'browser'])
+def test_blog_workflow_modules_exist(module_name):
+    """Test that refactored blog workflow modules exist (file lookup only, src.services is not imported)"""
+    services_dir = str(project_root / "src" / "services")
+    spec = importlib.machinery.PathFinder.find_spec(module_name, [services_dir])
+    assert spec is not None, f"Missing module: src.services.{module_name}"
+
+
+@pytest.mark.phase1
+@pytest.mark.parametrize("component", ['quality_verifier', 'content_manager', 'browser_cleanup_service'])
+def test_blog_workflow_initialization(blog_workflow_service, component):
+    """Test that BlogWorkflowService can be initialized with new components"""
+    assert hasattr(blog_workflow_service, component), f"Missing {component} attribute"
+
+
+@pytest.mark.phase1
+def test_quality_threshold_manager():
+    """Test quality threshold management"""
+    from src.services.quality import QualityThresholdManager
+    from src.config.settings import Settings
+
+    threshold_manager = QualityThresholdManager(Settings)
+
+    # Test threshold evaluation
+    result = threshold_manager.evaluate_quality_score(0.8)
+    assert result['passes_threshold'], "High score should pass"
+
+    result = threshold_manager.evaluate_quality_score(0.5)
+    assert not result['passes_threshold'], "Low score should fail"
+
+
+# Phase 2 Tests: Telegram Bot Logic Refactoring
+# (telegram 패키지가 필요한 검사는 test_refactoring_regression_telegram.py)
+@pytest.mark.phase2
+def test_telegram_import_resolution():
+    """Test that Telegram import conflicts are resolved"""
+    # Test that utils.py is removed
+    utils_py_path = Path("src/telegram/utils.py")
+    assert not utils_py_path.exists(), "utils.py still exists"
+
+
+@pytest.mark.phase2
+def test_safe_messaging_setting():
+    """Test that the safe messaging setting exists"""
+    from src.config.settings import Settings
+
+    safe_messaging_enabled = getattr(Settings, 'USE_SAFE_MESSAGING', None)
+    assert safe_messaging_enabled is not None, "Setting not found"
+
+
+# Phase 3 Tests: Startup Script Consolidation
+@pytest.mark.phase3
+def test_telegram_service_unification(telegram_service):
+    """Test unified telegram service"""
+    from src.services.telegram_service import TelegramBotService
+
+    # Test service creation
+    assert isinstance(telegram_service, TelegramBotService), "Wrong service type"
+
+
+@pytest.mark.phase3
+@pytest.mark.parametrize("method", ['_validate_configuration', '_install_dns_fallback', 'run', 'run_once'])
+def test_telegram_service_methods(telegram_service, method):
+    """Test unified telegram service configuration methods"""
+    assert hasattr(telegram_service, method), f"Missing: {method}"
+
+
+@pytest.fixture(scope="module")
+def backoff_telegram_service():
+    """Exponential backoff가 켜진 TelegramBotService"""
+    from src.services.telegram_service import TelegramBotService
+    return TelegramBotService(exponential_backoff=True, base_retry_delay=5)
+
+
+@pytest.mark.phase3
+def test_improved_process_management(backoff_telegram_service):
+    """Test improved process management features"""
+    service = backoff_telegram_service
+
+    # Test exponential backoff calculation
+    delay1 = service._calculate_retry_delay(1)
+    delay2 = service._calculate_retry_delay(2)
+    delay3 = service._calculate_retry_delay(3)
+    assert delay1 < delay2 < delay3, f"Delays not increasing: {delay1}, {delay2}, {delay3}"
+
+
+@pytest.mark.phase3
+@pytest.mark.parametrize("method", ['_setup_signal_handlers', '_perform_graceful_shutdown', 'add_shutdown_handler'])
+def test_graceful_shutdown_methods(backoff_telegram_service, method):
+    """Test graceful shutdown methods"""
+    assert hasattr(backoff_telegram_service, method), f"Missing: {method}"
+
+
+@pytest.fixture(scope="session")
+def systemd_artifacts():
+    """systemd 서비스 파일/설치 스크립트를 세션당 한 번만 읽는다"""
+    service_file = project_root / "scripts" / "naverpost-bot.service"
+    install_script = project_root / "scripts" / "install-systemd-service.sh"
+    service_exists = service_file.exists()
+    return {
+        "service_exists": service_exists,
+        "service_content": service_file.read_text() if service_exists else "",
+        "install_script": install_script,
+    }
+
+
+@pytest.mark.phase3
+def test_systemd_service_file_exists(systemd_artifacts):
+    """Test systemd service configuration exists"""
+    assert systemd_artifacts["service_exists"], "Systemd service file does not exist"
+
+
+@pytest.mark.phase3
+@pytest.mark.parametrize("section", ['[Unit]', '[Service]', '[Install]'])
+def test_systemd_service_file_structure(systemd_artifacts, section):
+    """Test systemd service file contains the required section"""
+    assert section in systemd_artifacts["service_content"], f"Missing: {section}"
+
+
+@pytest.mark.phase3
+def test_systemd_install_script_executable(systemd_artifacts):
+    """Test systemd install script exists and is executable"""
+    install_script = systemd_artifacts["install_script"]
+    assert install_script.exists() and install_script.stat().st_mode & 0o111, \
+        "Install script missing or not executable"
+
+
+# Integration Tests
+@pytest.mark.integration
+def test_blog_workflow_integration(blog_workflow_service):
+    """Test that blog workflow integration still works"""
+    service = blog_workflow_service
+
+    # Test that all components are present and functional
+    missing = [attr for attr in ('quality_verifier', 'content_manager') if not hasattr(service, attr)]
+    assert not missing, f"Missing: {missing}"
+
+
+# Storage Tests
+def test_data_manager_isolated_base_dir(tmp_path, monkeypatch):
+    """DateBasedDataManager(base_dir=...) must not create the Settings data directories"""
+    from src.config.settings import Settings
+    from src.storage.data_manager import DateBasedDataManager
+
+    settings_data_dir = tmp_path / "settings_data"
+    monkeypatch.setattr(Settings, "DATA_DIR", settings_data_dir)
+
+    isolated_dir = tmp_path / "isolated"
+    manager = DateBasedDataManager(base_dir=isolated_dir)
+
+    assert manager.date_manager.base_dir == isolated_dir
+    assert isolated_dir.is_dir(), "Isolated base_dir was not created"
+    assert not settings_data_dir.exists(), "Settings.DATA_DIR was created"